@@ -5,25 +5,42 @@ Passwordless authentication via email + CCPC profile URL.
 """
 
 import os
-from functools import wraps
-from flask import Flask, render_template, request, redirect, url_for, flash, session, g
+import csv
+import io
+import hmac
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from functools import partial, wraps
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, single dev process anyway
+    fcntl = None
+from flask import (
+    Flask, Response, render_template, request, redirect, url_for, flash, session, g,
+    stream_with_context, jsonify
+)
 from flask_wtf.csrf import CSRFProtect
+from flask_caching import Cache
+from flask_compress import Compress
 
 import models
 from models import (
-    get_db, close_db, init_db,
+    get_db, close_db, init_db, migrate_db, SQL_INSERT_USER,
     get_user_by_email, get_user_by_id, authenticate_member,
     get_candidates_by_category, generate_voter_hash,
-    get_voted_categories, record_vote, has_voted_in_category,
-    is_election_active, toggle_election, get_election_status,
-    get_results, get_total_voters,
-    CATEGORIES, CATEGORY_NAMES,
+    get_voted_categories, record_vote, get_vote_page_state,
+    is_election_active, toggle_election,
+    get_results, get_admin_dashboard_snapshot, get_position_overview,
+    CATEGORIES, CATEGORIES_SET, CATEGORY_NAMES,
     # New imports for preference-based system
     get_all_positions, get_position, toggle_position, 
     set_position_timeline, is_position_active, get_active_positions,
+    get_active_position_set,
     record_ranked_votes, has_voted_for_position, get_ranked_voted_positions,
     compute_all_results, save_election_winners, get_election_winners,
-    get_ranked_vote_count
+    set_computation_state, get_computation_status,
+    get_ranked_vote_count, get_results_version
 )
 
 # Initialize Flask app
@@ -31,28 +48,104 @@ app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
 app.config['WTF_CSRF_ENABLED'] = True
 
+# Constant template globals are registered once instead of per render
+app.jinja_env.globals.update(CATEGORY_NAMES=CATEGORY_NAMES)
+
 # Enable CSRF protection
 csrf = CSRFProtect(app)
 
+# Gzip text responses (results pages, CSV export)
+app.config['COMPRESS_MIMETYPES'] = ['text/html', 'text/csv', 'application/json']
+app.config['COMPRESS_MIN_SIZE'] = 500
+Compress(app)
+
+# In-process cache for rendered dashboards (single gunicorn worker by default)
+cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache'})
+
+# Bumped whenever votes or election status change, invalidating cached dashboards
+_election_version = 0
+
+# Last compute_all_results() output and the ballot/candidate-state key it was computed for
+_results_cache = {'key': None, 'val': None}
+
+# Single background worker so result computation never blocks a request worker
+_results_executor = ProcessPoolExecutor(max_workers=1)
+_results_future = None
+
+# Admin password - MUST be set via env var in production.
+# Read once at startup; only the development fallback is allowed without it.
+_ADMIN_PASSWORD = os.environ.get('ADMIN_PASSWORD')
+if not _ADMIN_PASSWORD and os.environ.get('FLASK_ENV', 'development') != 'production':
+    _ADMIN_PASSWORD = 'admin123'
+_ADMIN_PASSWORD = _ADMIN_PASSWORD.encode() if _ADMIN_PASSWORD else None
+
+# Admin user id, looked up on first admin login and reused afterwards
+_ADMIN_USER_ID = None
+
 # ============ AUTO-INITIALIZE DATABASE ============
+INIT_SENTINEL = '.db_initialized'
+INIT_LOCK = '.db_init.lock'
+
+
 def auto_initialize():
-    """Auto-initialize database on first request if tables don't exist."""
+    """Auto-initialize database on startup, then apply any pending schema migrations."""
+    DATABASE = 'election.db'
+    _ensure_initialized(DATABASE)
+    _migrate_database(DATABASE)
+
+
+def _ensure_initialized(DATABASE):
+    """Create and seed the database unless a previous boot already did."""
+    # Warm boot: nothing to seed
+    if os.path.exists(DATABASE) and os.path.exists(INIT_SENTINEL):
+        return
+    
+    # Only one gunicorn worker seeds; the others wait, then see the sentinel
+    with open(INIT_LOCK, 'w') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            if os.path.exists(DATABASE) and os.path.exists(INIT_SENTINEL):
+                return
+            # A DB seeded by init_all.py, or before the sentinel existed, only needs marking
+            if not _database_has_users(DATABASE):
+                _initialize_database(DATABASE)
+            with open(INIT_SENTINEL, 'w'):
+                pass
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _migrate_database(DATABASE):
+    """Upgrade an existing database to the current schema (cheap no-op once done)."""
     import sqlite3
-    import json
     
-    DATABASE = 'election.db'
+    conn = sqlite3.connect(DATABASE, isolation_level=None)
+    try:
+        migrate_db(conn)
+    finally:
+        conn.close()
+
+
+def _database_has_users(DATABASE):
+    """Check whether the users table exists and is populated."""
+    import sqlite3
     
-    # Check if database needs initialization
     try:
         conn = sqlite3.connect(DATABASE)
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM users")
         count = cursor.fetchone()[0]
         conn.close()
-        if count > 0:
-            return  # Already initialized
+        return count > 0
     except sqlite3.OperationalError:
-        pass  # Table doesn't exist, need to initialize
+        return False  # Table doesn't exist, need to initialize
+
+
+def _initialize_database(DATABASE):
+    """Create the schema and seed admin, candidates and members."""
+    import sqlite3
     
     print("=" * 50)
     print("AUTO-INITIALIZING DATABASE...")
@@ -62,17 +155,24 @@ def auto_initialize():
     with open('schema.sql', 'r') as f:
         schema = f.read()
     
-    conn = sqlite3.connect(DATABASE)
+    # Autocommit mode: the seed inserts below run in one explicit transaction
+    conn = sqlite3.connect(DATABASE, isolation_level=None, cached_statements=256)
+    # WAL is persistent, so setting it here covers later app connections too
+    conn.executescript(
+        "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; "
+        "PRAGMA temp_store=MEMORY; PRAGMA mmap_size=268435456;"
+    )
     conn.executescript(schema)
-    conn.commit()
     print("✓ Schema created")
     
+    # Take the write lock up front instead of upgrading mid-transaction
+    conn.execute("BEGIN IMMEDIATE")
+    
     # Create admin user
     conn.execute(
-        "INSERT OR IGNORE INTO users (name, email, ccpc_profile_id, is_admin) VALUES (?, ?, ?, ?)",
+        SQL_INSERT_USER,
         ('Admin', 'admin@club.com', 'ADMIN', True)
     )
-    conn.commit()
     print("✓ Admin user created")
     
     # Seed candidates
@@ -88,51 +188,30 @@ def auto_initialize():
         'EXEC_PR': ALL_NOMINEES,
     }
     
-    for category, candidates in categories.items():
-        for name in candidates:
-            conn.execute(
-                "INSERT OR IGNORE INTO candidates (name, category) VALUES (?, ?)",
-                (name, category)
-            )
-    conn.commit()
+    candidate_rows = [
+        (name, category)
+        for category, candidates in categories.items()
+        for name in candidates
+    ]
+    # One multi-row INSERT: ~100 rows stays well under SQLite's bound-variable limit
+    conn.execute(
+        "INSERT OR IGNORE INTO candidates (name, category) VALUES "
+        + ", ".join(["(?, ?)"] * len(candidate_rows)),
+        [value for row in candidate_rows for value in row]
+    )
     print("✓ Candidates seeded")
     
     # Seed members from Firebase
-    FIREBASE_EXPORT = 'soc-ccpc-cuj-default-rtdb-export.json'
+    from seed_members_from_firebase import FIREBASE_EXPORT, iter_firebase_members
     if os.path.exists(FIREBASE_EXPORT):
-        with open(FIREBASE_EXPORT, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        users = data.get('users', {})
-        for profile_id, user_data in users.items():
-            if not user_data.get('completeProfile', False):
-                continue
-            if not user_data.get('isMember', False):
-                continue
-            
-            name = user_data.get('name', '').strip()
-            email = user_data.get('email', '').strip().lower()
-            
-            if not name or not email:
-                continue
-            
-            conn.execute(
-                "INSERT OR IGNORE INTO users (name, email, ccpc_profile_id, is_admin) VALUES (?, ?, ?, ?)",
-                (name, email, profile_id, False)
-            )
-        
-        # Add members with manually specified emails
-        conn.execute(
-            "INSERT OR IGNORE INTO users (name, email, ccpc_profile_id, is_admin) VALUES (?, ?, ?, ?)",
-            ('Basil Joy', 'basil.23190503023@cuj.ac.in', 'ZnStO6ic3fM6MQLiI5iUBZnyyC63', False)
-        )
-        conn.execute(
-            "INSERT OR IGNORE INTO users (name, email, ccpc_profile_id, is_admin) VALUES (?, ?, ?, ?)",
-            ('Shashi Kumari Verma', 'shashi.24190503050@cuj.ac.in', 's8ZKdaxsWPWl1hQoTDhon47uy9O2', False)
+        conn.executemany(
+            SQL_INSERT_USER,
+            ((*row, False) for row in iter_firebase_members())
         )
-        conn.commit()
         print("✓ Members seeded from Firebase")
     
+    conn.execute("COMMIT")
+    
     # Count totals
     cursor = conn.cursor()
     cursor.execute("SELECT COUNT(*) FROM users")
@@ -155,13 +234,105 @@ with app.app_context():
 app.teardown_appcontext(close_db)
 
 
+# ============ TEMPLATE HELPERS ============
+
+# Hot dashboard templates, loaded once at startup
+_TEMPLATES = {
+    name: app.jinja_env.get_template(name)
+    for name in ('dashboard.html', 'ranked_dashboard.html', 'admin.html')
+}
+
+
+def _render_cached(template_name, **context):
+    """Render a preloaded template with the usual context processors applied."""
+    app.update_template_context(context)
+    return _TEMPLATES[template_name].render(context)
+
+
+# ============ REQUEST HELPERS ============
+
+def _load_current_user():
+    """Load the logged-in user once per request and cache it on g."""
+    if not hasattr(g, 'current_user'):
+        uid = session.get('user_id')
+        g.current_user = get_user_by_id(uid) if uid is not None else None
+        if uid is not None and g.current_user is None:
+            # The account is gone: drop the stale login so /login doesn't bounce back
+            session.pop('user_id', None)
+            session.pop('is_admin', None)
+            session.pop('voter_hash', None)
+    return g.current_user
+
+
+def _election_active_cached():
+    """Check the election status once per request and cache it on g."""
+    if not hasattr(g, '_election_active'):
+        g._election_active = is_election_active()
+    return g._election_active
+
+
+def _active_positions():
+    """Get the set of currently active position codes once per request."""
+    if not hasattr(g, 'active_positions'):
+        g.active_positions = get_active_position_set()
+    return g.active_positions
+
+
+def _voter_hash():
+    """Get the current user's voter hash, computed at login and kept on the session."""
+    voter_hash = session.get('voter_hash')
+    if voter_hash is None:
+        # Sessions created before the hash was stored at login
+        voter_hash = session['voter_hash'] = generate_voter_hash(g.current_user['id'], app.secret_key)
+    return voter_hash
+
+
+def _bump_election_version():
+    """Invalidate cached dashboards after a vote or status change."""
+    global _election_version
+    _election_version += 1
+
+
+def _dashboard_cache_key(*args, **kwargs):
+    """Cache key for a voter's rendered dashboard."""
+    return f"dash:{session.get('user_id')}:{_election_version}"
+
+
+def _has_pending_flashes():
+    """Don't serve or store cached pages while flash messages are queued."""
+    return bool(session.get('_flashes'))
+
+
+def _computed_results():
+    """Return compute_all_results(), recomputing only when ballots or candidates change."""
+    key = get_results_version()
+    if _results_cache['key'] != key:
+        _results_cache['val'] = compute_all_results()
+        _results_cache['key'] = key
+    return _results_cache['val']
+
+
+def _invalidate_results():
+    """Force the next results request to recompute."""
+    _results_cache['key'] = None
+
+
+def _get_admin_id():
+    """Return the default admin's user id, querying the database only once."""
+    global _ADMIN_USER_ID
+    if _ADMIN_USER_ID is None:
+        admin = get_user_by_email('admin@club.com')
+        _ADMIN_USER_ID = admin['id'] if admin else None
+    return _ADMIN_USER_ID
+
+
 # ============ DECORATORS ============
 
 def login_required(f):
     """Decorator to require login for routes."""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if 'user_id' not in session:
+        if _load_current_user() is None:
             flash('Please log in to access this page.', 'warning')
             return redirect(url_for('login'))
         return f(*args, **kwargs)
@@ -172,11 +343,11 @@ def admin_required(f):
     """Decorator to require admin login for routes."""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if 'user_id' not in session:
+        user = _load_current_user()
+        if user is None:
             flash('Please log in to access this page.', 'warning')
             return redirect(url_for('login'))
-        user = get_user_by_id(session['user_id'])
-        if not user or not user['is_admin']:
+        if not user['is_admin']:
             flash('Admin access required.', 'danger')
             return redirect(url_for('ranked_dashboard'))
         return f(*args, **kwargs)
@@ -187,7 +358,7 @@ def election_active_required(f):
     """Decorator to require active election for voting."""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if not is_election_active():
+        if not _election_active_cached():
             flash('Voting is currently closed.', 'warning')
             return redirect(url_for('ranked_dashboard'))
         return f(*args, **kwargs)
@@ -199,13 +370,9 @@ def election_active_required(f):
 @app.context_processor
 def inject_globals():
     """Inject global variables into all templates."""
-    user = None
-    if 'user_id' in session:
-        user = get_user_by_id(session['user_id'])
     return {
-        'current_user': user,
-        'election_active': is_election_active(),
-        'CATEGORY_NAMES': CATEGORY_NAMES
+        'current_user': _load_current_user(),
+        'election_active': _election_active_cached()
     }
 
 
@@ -214,7 +381,7 @@ def inject_globals():
 @app.route('/login', methods=['GET', 'POST'])
 def login():
     """Login page - authenticate with email + CCPC profile URL."""
-    if 'user_id' in session:
+    if session.get('user_id') is not None:
         return redirect(url_for('ranked_dashboard'))
     
     if request.method == 'POST':
@@ -226,6 +393,8 @@ def login():
         
         if user:
             session['user_id'] = user['id']
+            session['is_admin'] = bool(user['is_admin'])
+            session['voter_hash'] = generate_voter_hash(user['id'], app.secret_key)
             flash(f'Welcome, {user["name"]}!', 'success')
             
             if user['is_admin']:
@@ -240,33 +409,26 @@ def login():
 @app.route('/admin/login', methods=['GET', 'POST'])
 def admin_login():
     """Admin login page - password-based authentication."""
-    if 'user_id' in session:
-        user = get_user_by_id(session['user_id'])
-        if user and user['is_admin']:
+    if session.get('user_id') is not None:
+        if session.get('is_admin'):
             return redirect(url_for('admin'))
         return redirect(url_for('ranked_dashboard'))
     
     if request.method == 'POST':
         password = request.form.get('password', '').strip()
         
-        # Admin password check - MUST be set via env var in production
-        ADMIN_PASSWORD = os.environ.get('ADMIN_PASSWORD')
-        FLASK_ENV = os.environ.get('FLASK_ENV', 'development')
-        
         # Security: Require ADMIN_PASSWORD env var in production
-        if not ADMIN_PASSWORD:
-            if FLASK_ENV == 'production':
-                flash('Admin password not configured. Contact system administrator.', 'danger')
-                return render_template('admin_login.html')
-            else:
-                # Only allow default in development
-                ADMIN_PASSWORD = 'admin123'
+        if _ADMIN_PASSWORD is None:
+            flash('Admin password not configured. Contact system administrator.', 'danger')
+            return render_template('admin_login.html')
         
-        if password == ADMIN_PASSWORD:
-            # Get or create admin user
-            admin = get_user_by_email('admin@club.com')
-            if admin:
-                session['user_id'] = admin['id']
+        # Constant-time comparison against the password read at startup
+        if hmac.compare_digest(password.encode(), _ADMIN_PASSWORD):
+            admin_id = _get_admin_id()
+            if admin_id is not None:
+                session['user_id'] = admin_id
+                session['is_admin'] = True
+                session['voter_hash'] = generate_voter_hash(admin_id, app.secret_key)
                 flash('Welcome, Admin!', 'success')
                 return redirect(url_for('admin'))
             else:
@@ -280,7 +442,9 @@ def admin_login():
 @app.route('/logout')
 def logout():
     """Logout and clear session."""
-    session.clear()
+    session.pop('user_id', None)
+    session.pop('is_admin', None)
+    session.pop('voter_hash', None)
     flash('You have been logged out.', 'info')
     return redirect(url_for('login'))
 
@@ -296,32 +460,31 @@ def dashboard():
 
 @app.route('/legacy-dashboard')
 @login_required
+@cache.cached(timeout=60, make_cache_key=_dashboard_cache_key, unless=_has_pending_flashes)
 def legacy_dashboard():
     """Voting dashboard showing all categories with per-position status."""
-    user = get_user_by_id(session['user_id'])
-    voter_hash = generate_voter_hash(user['id'], app.secret_key)
+    voter_hash = _voter_hash()
     voted_categories = get_voted_categories(voter_hash)
     voted_positions = get_ranked_voted_positions(voter_hash)
     
     # Combine legacy votes and ranked votes
     all_voted = set(voted_categories) | set(voted_positions)
     
-    categories_status = []
-    any_active = False
-    for cat in CATEGORIES:
-        is_active = is_position_active(cat)
-        if is_active:
-            any_active = True
-        categories_status.append({
+    active = _active_positions()
+    categories_status = [
+        {
             'code': cat,
             'name': CATEGORY_NAMES[cat],
             'voted': cat in all_voted,
-            'is_active': is_active  # Per-position status
-        })
+            'is_active': cat in active  # Per-position status
+        }
+        for cat in CATEGORIES
+    ]
+    any_active = any(cat['is_active'] for cat in categories_status)
     
-    all_voted_complete = len(all_voted) == len(CATEGORIES)
+    all_voted_complete = len(all_voted) >= len(CATEGORIES)
     
-    return render_template(
+    return _render_cached(
         'dashboard.html',
         categories=categories_status,
         all_voted=all_voted_complete,
@@ -334,20 +497,19 @@ def legacy_dashboard():
 @election_active_required
 def vote(category):
     """Vote in a specific category."""
-    if category not in CATEGORIES:
+    if category not in CATEGORIES_SET:
         flash('Invalid category.', 'danger')
         return redirect(url_for('dashboard'))
     
-    user = get_user_by_id(session['user_id'])
-    voter_hash = generate_voter_hash(user['id'], app.secret_key)
+    voter_hash = _voter_hash()
+    
+    already_voted, candidates = get_vote_page_state(voter_hash, category)
     
     # Check if already voted
-    if has_voted_in_category(voter_hash, category):
+    if already_voted:
         flash('You have already voted in this category.', 'warning')
         return redirect(url_for('dashboard'))
     
-    candidates = get_candidates_by_category(category)
-    
     if not candidates:
         flash('No candidates available for this category.', 'warning')
         return redirect(url_for('dashboard'))
@@ -374,6 +536,7 @@ def vote(category):
         success, message = record_vote(category, candidate_id, voter_hash)
         
         if success:
+            _bump_election_version()
             return redirect(url_for('confirmation'))
         else:
             flash(message, 'danger')
@@ -400,31 +563,11 @@ def confirmation():
 @admin_required
 def admin():
     """Admin dashboard."""
-    results = get_results()
-    election_status = get_election_status()
-    total_voters = get_total_voters()
-    ranked_voter_count = get_ranked_vote_count()
-    winners = get_election_winners()
+    snapshot = get_admin_dashboard_snapshot()
     
-    # Get positions with active status
-    positions = get_all_positions()
-    position_data = []
-    for pos in positions:
-        position_data.append({
-            'code': pos['position_code'],
-            'name': pos['position_name'],
-            'is_active': pos['is_active'],
-            'is_currently_active': is_position_active(pos['position_code'])
-        })
-    
-    return render_template(
+    return _render_cached(
         'admin.html',
-        results=results,
-        election_status=election_status,
-        total_voters=total_voters,
-        ranked_voter_count=ranked_voter_count,
-        winners=winners,
-        positions=position_data,
+        **snapshot,
         categories=CATEGORIES,
         category_names=CATEGORY_NAMES
     )
@@ -435,6 +578,8 @@ def admin():
 def admin_toggle():
     """Toggle election status."""
     new_status = toggle_election()
+    _bump_election_version()
+    _invalidate_results()
     status_text = 'started' if new_status else 'stopped'
     flash(f'Election has been {status_text}.', 'success')
     return redirect(url_for('admin'))
@@ -444,27 +589,32 @@ def admin_toggle():
 @admin_required
 def admin_export():
     """Export results as CSV."""
-    from flask import Response
-    import csv
-    import io
-    
-    results = get_results()
-    
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(['Category', 'Candidate', 'Votes'])
-    
-    for category in CATEGORIES:
-        if category in results:
-            for candidate in results[category]:
-                writer.writerow([
-                    CATEGORY_NAMES[category],
-                    candidate['name'],
-                    candidate['votes']
-                ])
-    
+    def generate():
+        results = get_results()
+        
+        # Reuse one small buffer so csv handles quoting while rows stream out
+        line = io.StringIO()
+        writer = csv.writer(line)
+        
+        def emit(row):
+            line.seek(0)
+            line.truncate()
+            writer.writerow(row)
+            return line.getvalue()
+        
+        yield emit(['Category', 'Candidate', 'Votes'])
+        for category in CATEGORIES:
+            if category in results:
+                for candidate in results[category]:
+                    yield emit([
+                        CATEGORY_NAMES[category],
+                        candidate['name'],
+                        candidate['votes']
+                    ])
+    
+    # stream_with_context keeps g (and its DB connection) alive while streaming
     return Response(
-        output.getvalue(),
+        stream_with_context(generate()),
         mimetype='text/csv',
         headers={'Content-Disposition': 'attachment;filename=election_results.csv'}
     )
@@ -476,28 +626,14 @@ def admin_export():
 @admin_required
 def admin_positions():
     """Admin page for managing election positions."""
-    positions = get_all_positions()
-    winners = get_election_winners()
-    ranked_voter_count = get_ranked_vote_count()
-    
-    # Build position status with active check
-    position_data = []
-    for pos in positions:
-        position_data.append({
-            'code': pos['position_code'],
-            'name': pos['position_name'],
-            'rank_order': pos['rank_order'],
-            'is_active': pos['is_active'],
-            'is_currently_active': is_position_active(pos['position_code']),
-            'opens_at': pos['opens_at'],
-            'closes_at': pos['closes_at']
-        })
+    positions, winners, ranked_voter_count = get_position_overview()
     
     return render_template(
         'admin_positions.html',
-        positions=position_data,
+        positions=positions,
         winners=winners,
-        ranked_voter_count=ranked_voter_count
+        ranked_voter_count=ranked_voter_count,
+        computation=get_computation_status()
     )
 
 
@@ -506,6 +642,8 @@ def admin_positions():
 def admin_toggle_position(position_code):
     """Toggle a specific position's voting status."""
     new_status = toggle_position(position_code)
+    _bump_election_version()
+    _invalidate_results()
     status_text = 'opened' if new_status else 'closed'
     flash(f'{CATEGORY_NAMES.get(position_code, position_code)} voting has been {status_text}.', 'success')
     return redirect(url_for('admin_positions'))
@@ -515,8 +653,6 @@ def admin_toggle_position(position_code):
 @admin_required
 def admin_set_timeline(position_code):
     """Set timeline for a specific position."""
-    from datetime import datetime
-    
     opens_at = request.form.get('opens_at', '').strip() or None
     closes_at = request.form.get('closes_at', '').strip() or None
     
@@ -547,26 +683,105 @@ def admin_set_timeline(position_code):
         return redirect(url_for('admin_positions'))
     
     set_position_timeline(position_code, opens_at, closes_at)
+    _bump_election_version()
     flash(f'Timeline updated for {CATEGORY_NAMES.get(position_code, position_code)}.', 'success')
     return redirect(url_for('admin_positions'))
 
 
 
+def _compute_and_save():
+    """Runs in the executor process: mark the run started, compute and save winners, record the outcome."""
+    with app.app_context():
+        # Marked here rather than before submit(): the job only claims 'running' once it exists
+        set_computation_state('running')
+        try:
+            save_election_winners(compute_all_results())
+        except Exception:
+            # Never let the state update commit a half-finished winners rewrite
+            db = get_db()
+            if db.in_transaction:
+                db.rollback()
+            set_computation_state('failed')
+            raise
+        set_computation_state('done')
+
+
+def _replace_results_executor(broken):
+    """Swap in a fresh executor; a pool whose worker died rejects every later submit."""
+    global _results_executor
+    if _results_executor is broken:
+        _results_executor = ProcessPoolExecutor(max_workers=1)
+        broken.shutdown(wait=False)
+
+
+def _log_compute_outcome(executor, future):
+    """Done-callback: log a failed background computation with the worker's traceback."""
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is None:
+        return
+    app.logger.error('Results computation failed', exc_info=exc)
+    if isinstance(exc, BrokenProcessPool):
+        # The worker was killed before it could record the outcome itself
+        _replace_results_executor(executor)
+        with app.app_context():
+            set_computation_state('failed')
+
+
+def _submit_results_job():
+    """Submit _compute_and_save, replacing the executor once if its worker has died."""
+    executor = _results_executor
+    try:
+        future = executor.submit(_compute_and_save)
+    except BrokenProcessPool:
+        _replace_results_executor(executor)
+        executor = _results_executor
+        future = executor.submit(_compute_and_save)
+    future.add_done_callback(partial(_log_compute_outcome, executor))
+    return future
+
+
 @app.route('/admin/compute-results', methods=['POST'])
 @admin_required
 def admin_compute_results():
-    """Compute and save election results using preference recomputation."""
-    results = compute_all_results()
-    save_election_winners(results)
-    flash('Election results computed and saved!', 'success')
+    """Start computing election results in the background."""
+    global _results_future
+    if _results_future is not None and not _results_future.done():
+        flash('Results are already being computed.', 'warning')
+        return redirect(url_for('admin_positions'))
+    
+    try:
+        _results_future = _submit_results_job()
+    except Exception:
+        app.logger.exception('Could not start results computation')
+        set_computation_state('failed')
+        flash('Could not start the results computation. See the server log for details.', 'danger')
+        return redirect(url_for('admin_positions'))
+    
+    flash('Computing election results in the background. Refresh shortly; the run status is shown below.', 'info')
     return redirect(url_for('admin_positions'))
 
 
+@app.route('/admin/compute-status')
+@admin_required
+def admin_compute_status():
+    """Report the state of the background results computation."""
+    status = get_computation_status()
+    if status is None:
+        return jsonify(state='idle', started_at=None, completed_at=None)
+    return jsonify(
+        state=status['state'],
+        started_at=status['started_at'],
+        completed_at=status['completed_at']
+    )
+
+
 @app.route('/admin/results')
 @admin_required
 def admin_view_results():
     """View detailed recomputed results."""
-    results = compute_all_results()
+    results = _computed_results()
     winners = get_election_winners()
     ranked_voter_count = get_ranked_vote_count()
     
@@ -584,7 +799,7 @@ def admin_view_results():
 @login_required
 def ranked_vote_page(position):
     """Show ranked voting page for a position."""
-    if position not in CATEGORIES:
+    if position not in CATEGORIES_SET:
         flash('Invalid position.', 'danger')
         return redirect(url_for('ranked_dashboard'))
     
@@ -592,8 +807,7 @@ def ranked_vote_page(position):
         flash(f'Voting for {CATEGORY_NAMES[position]} is currently closed.', 'warning')
         return redirect(url_for('ranked_dashboard'))
     
-    user = get_user_by_id(session['user_id'])
-    voter_hash = generate_voter_hash(user['id'], app.secret_key)
+    voter_hash = _voter_hash()
     
     if has_voted_for_position(voter_hash, position):
         flash('You have already voted for this position.', 'warning')
@@ -617,22 +831,11 @@ def ranked_vote_page(position):
 @login_required
 def submit_ranked_vote(position):
     """Submit ranked preference votes."""
-    if position not in CATEGORIES:
+    if position not in CATEGORIES_SET:
         flash('Invalid position.', 'danger')
         return redirect(url_for('ranked_dashboard'))
     
-    if not is_position_active(position):
-        flash(f'Voting for {CATEGORY_NAMES[position]} is currently closed.', 'warning')
-        return redirect(url_for('ranked_dashboard'))
-    
-    user = get_user_by_id(session['user_id'])
-    voter_hash = generate_voter_hash(user['id'], app.secret_key)
-    
-    if has_voted_for_position(voter_hash, position):
-        flash('You have already voted for this position.', 'warning')
-        return redirect(url_for('ranked_dashboard'))
-    
-    # Parse ranked candidates from form
+    # Parse ranked candidates from form before touching the database
     ranked_ids_str = request.form.get('ranked_candidates', '')
     
     if not ranked_ids_str:
@@ -649,10 +852,32 @@ def submit_ranked_vote(position):
         flash('Please rank at least one candidate.', 'danger')
         return redirect(url_for('ranked_vote_page', position=position))
     
+    if len(set(ranked_ids)) != len(ranked_ids):
+        flash('Each candidate can only be ranked once.', 'danger')
+        return redirect(url_for('ranked_vote_page', position=position))
+    
+    if not is_position_active(position):
+        flash(f'Voting for {CATEGORY_NAMES[position]} is currently closed.', 'warning')
+        return redirect(url_for('ranked_dashboard'))
+    
+    # A valid ballot never lists more ids than the position has candidates;
+    # this also keeps the model's IN (...) list under SQLite's variable limit
+    if len(ranked_ids) > len(get_candidates_by_category(position)):
+        flash('Invalid candidate selection.', 'danger')
+        return redirect(url_for('ranked_vote_page', position=position))
+    
+    voter_hash = _voter_hash()
+    
+    if has_voted_for_position(voter_hash, position):
+        flash('You have already voted for this position.', 'warning')
+        return redirect(url_for('ranked_dashboard'))
+    
     # Record the ranked votes
     success, message = record_ranked_votes(voter_hash, position, ranked_ids)
     
     if success:
+        _bump_election_version()
+        _invalidate_results()
         flash(f'Your ranked vote for {CATEGORY_NAMES[position]} has been recorded!', 'success')
         return redirect(url_for('confirmation'))
     else:
@@ -664,18 +889,18 @@ def submit_ranked_vote(position):
 @login_required
 def ranked_dashboard():
     """Dashboard for ranked preference voting."""
-    user = get_user_by_id(session['user_id'])
-    voter_hash = generate_voter_hash(user['id'], app.secret_key)
+    voter_hash = _voter_hash()
     voted_positions = get_ranked_voted_positions(voter_hash)
     
     positions = get_all_positions()
+    active = _active_positions()
     position_status = []
     
     for pos in positions:
         position_status.append({
             'code': pos['position_code'],
             'name': pos['position_name'],
-            'is_active': is_position_active(pos['position_code']),
+            'is_active': pos['position_code'] in active,
             'voted': pos['position_code'] in voted_positions,
             'opens_at': pos['opens_at'],
             'closes_at': pos['closes_at']
@@ -683,7 +908,7 @@ def ranked_dashboard():
     
     all_voted = len(voted_positions) == len(CATEGORIES)
     
-    return render_template(
+    return _render_cached(
         'ranked_dashboard.html',
         positions=position_status,
         all_voted=all_voted
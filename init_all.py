@@ -9,6 +9,8 @@ Usage: python init_all.py
 import os
 import sqlite3
 
+from models import SQL_INSERT_USER, migrate_db
+
 DATABASE = 'election.db'
 
 def init_database():
@@ -20,14 +22,22 @@ def init_database():
         schema = f.read()
     
     conn = sqlite3.connect(DATABASE)
+    # WAL is persistent, so setting it here covers later app connections too
+    conn.executescript(
+        "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; "
+        "PRAGMA temp_store=MEMORY; PRAGMA mmap_size=268435456;"
+    )
     conn.executescript(schema)
     conn.commit()
     
+    # Existing databases keep their old tables; upgrade them in place
+    migrate_db(conn)
+    
     # Create default admin if not exists
     cursor = conn.execute("SELECT id FROM users WHERE email = ?", ('admin@club.com',))
     if cursor.fetchone() is None:
         conn.execute(
-            "INSERT INTO users (name, email, ccpc_profile_id, is_admin) VALUES (?, ?, ?, ?)",
+            SQL_INSERT_USER,
             ('Admin', 'admin@club.com', 'ADMIN', True)
         )
         conn.commit()
@@ -39,72 +49,39 @@ def init_database():
 
 def seed_candidates():
     """Seed all candidates."""
-    from seed_candidates import seed_candidates as do_seed
+    from seed_candidates import open_db, seed_candidates as do_seed
     print("\nSeeding candidates...")
-    do_seed()
+    conn = open_db()
+    try:
+        do_seed(conn)
+    finally:
+        conn.close()
 
 
 def seed_members():
     """Seed all members from Firebase export."""
-    import json
+    from seed_members_from_firebase import FIREBASE_EXPORT, iter_firebase_members
     
     print("\nSeeding members from Firebase export...")
     
-    FIREBASE_EXPORT = 'soc-ccpc-cuj-default-rtdb-export.json'
-    
     if not os.path.exists(FIREBASE_EXPORT):
         print(f"⚠️ {FIREBASE_EXPORT} not found, skipping member seeding")
         return
     
-    with open(FIREBASE_EXPORT, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    users = data.get('users', {})
-    conn = sqlite3.connect(DATABASE)
-    cursor = conn.cursor()
-    
-    inserted = 0
-    
-    for profile_id, user_data in users.items():
-        if not user_data.get('completeProfile', False):
-            continue
-        if not user_data.get('isMember', False):
-            continue
-        
-        name = user_data.get('name', '').strip()
-        email = user_data.get('email', '').strip().lower()
-        
-        if not name or not email:
-            continue
-        
-        try:
-            cursor.execute(
-                "INSERT OR IGNORE INTO users (name, email, ccpc_profile_id, is_admin) VALUES (?, ?, ?, ?)",
-                (name, email, profile_id, False)
-            )
-            if cursor.rowcount > 0:
-                inserted += 1
-        except sqlite3.Error:
-            pass
-    
-    # Add manually specified members (those without email in Firebase)
-    manual_members = [
-        ('Basil Joy', 'basil.23190503023@cuj.ac.in', 'ZnStO6ic3fM6MQLiI5iUBZnyyC63'),
-        ('Shashi Kumari Verma', 'shashi.24190503050@cuj.ac.in', 's8ZKdaxsWPWl1hQoTDhon47uy9O2'),
-    ]
-    
-    for name, email, profile_id in manual_members:
-        try:
-            cursor.execute(
-                "INSERT OR IGNORE INTO users (name, email, ccpc_profile_id, is_admin) VALUES (?, ?, ?, ?)",
-                (name, email, profile_id, False)
-            )
-            if cursor.rowcount > 0:
-                inserted += 1
-        except sqlite3.Error:
-            pass
-    
-    conn.commit()
+    conn = sqlite3.connect(DATABASE, isolation_level=None)
+    
+    # Stage rows in an unindexed temp table, then dedup against users in one
+    # set-based INSERT ... SELECT, all inside a single transaction
+    conn.execute("BEGIN IMMEDIATE")
+    conn.execute("CREATE TEMP TABLE tmp_users (name TEXT, email TEXT, ccpc_profile_id TEXT)")
+    conn.executemany("INSERT INTO tmp_users VALUES (?, ?, ?)", iter_firebase_members())
+    cursor = conn.execute(
+        """INSERT OR IGNORE INTO users (name, email, ccpc_profile_id, is_admin)
+           SELECT name, email, ccpc_profile_id, 0 FROM tmp_users"""
+    )
+    inserted = cursor.rowcount
+    conn.execute("DROP TABLE tmp_users")
+    conn.execute("COMMIT")
     conn.close()
     
     # Count total
@@ -4,9 +4,17 @@ Uses SQLite for simplicity and portability.
 Passwordless authentication via email + CCPC profile URL.
 """
 
+import os
+import queue
 import sqlite3
 import hashlib
 import re
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from flask import g
 
 DATABASE = 'election.db'
@@ -14,6 +22,9 @@ DATABASE = 'election.db'
 # Valid voting categories
 CATEGORIES = ['VP', 'GS', 'JS1', 'JS2', 'TREASURER', 'EXEC_TECH', 'EXEC_DESIGN', 'EXEC_PR']
 
+# Frozen set for O(1) membership checks; CATEGORIES keeps display order
+CATEGORIES_SET = frozenset(CATEGORIES)
+
 CATEGORY_NAMES = {
     'VP': 'Vice President',
     'GS': 'General Secretary',
@@ -26,19 +37,66 @@ CATEGORY_NAMES = {
 }
 
 
+# Applied to every request connection; journal_mode=WAL persists in the file
+DB_PRAGMAS = (
+    "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; "
+    "PRAGMA temp_store=MEMORY; PRAGMA cache_size=-64000; "
+    "PRAGMA mmap_size=268435456;"
+)
+
+
+# Idle connections kept warm across requests (most recently used first)
+POOL_SIZE = 8
+_pool = queue.LifoQueue(maxsize=POOL_SIZE)
+
+
+def _reset_pool():
+    """Drop pooled connections inherited by a forked child process."""
+    global _pool
+    _pool = queue.LifoQueue(maxsize=POOL_SIZE)
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_pool)
+
+
+def _connect():
+    """Open a new configured connection."""
+    db = sqlite3.connect(
+        DATABASE, isolation_level=None, check_same_thread=False, cached_statements=256
+    )
+    db.row_factory = sqlite3.Row
+    db.executescript(DB_PRAGMAS)
+    return db
+
+
 def get_db():
-    """Get database connection, creating one if needed."""
+    """Get database connection, checking one out of the pool if needed."""
     if 'db' not in g:
-        g.db = sqlite3.connect(DATABASE)
-        g.db.row_factory = sqlite3.Row
+        try:
+            g.db = _pool.get_nowait()
+        except queue.Empty:
+            g.db = _connect()
     return g.db
 
 
+def _tuple_cursor(db):
+    """Cursor returning plain tuples, for bulk scans that skip sqlite3.Row."""
+    cursor = db.cursor()
+    cursor.row_factory = None
+    return cursor
+
+
 def close_db(e=None):
-    """Close database connection."""
+    """Return database connection to the pool."""
     db = g.pop('db', None)
     if db is not None:
-        db.close()
+        if db.in_transaction:
+            db.rollback()
+        try:
+            _pool.put_nowait(db)
+        except queue.Full:
+            db.close()
 
 
 def init_db(app):
@@ -49,18 +107,96 @@ def init_db(app):
             db.executescript(f.read())
         db.commit()
         
+        migrate_db(db)
+        
+        # Refresh planner statistics so the indexes above get picked
+        db.execute("ANALYZE")
+        
         # Create default admin if not exists
         cursor = db.execute("SELECT id FROM users WHERE email = ?", ('admin@club.com',))
         if cursor.fetchone() is None:
             db.execute(
-                "INSERT INTO users (name, email, ccpc_profile_id, is_admin) VALUES (?, ?, ?, ?)",
+                SQL_INSERT_USER,
                 ('Admin', 'admin@club.com', 'ADMIN', True)
             )
             db.commit()
 
 
+def _pending_migrations(conn):
+    """Names of the schema upgrades an existing database still needs."""
+    tables = dict(conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'table'"))
+    pending = []
+    if 'users' in tables and 'NOCASE' not in tables['users'].upper():
+        pending.append('users_email_nocase')
+    if 'results_computation' not in tables:
+        pending.append('results_computation')
+    if 'candidate_name' in {row[1] for row in conn.execute("PRAGMA table_info(election_winners)")}:
+        pending.append('drop_winner_name')
+    return pending
+
+
+def migrate_db(conn):
+    """
+    Bring an existing database up to the current schema.
+    Takes any sqlite3 connection in autocommit or legacy mode; safe to run on every start.
+    """
+    if not _pending_migrations(conn):
+        return
+    
+    # Re-check under the write lock: another worker may have migrated meanwhile
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        pending = _pending_migrations(conn)
+        
+        # Background results computation status, added after the first deployments
+        if 'results_computation' in pending:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS results_computation (
+                     id INTEGER PRIMARY KEY CHECK (id = 1),
+                     state TEXT NOT NULL DEFAULT 'idle',
+                     started_at TIMESTAMP,
+                     completed_at TIMESTAMP
+                   )"""
+            )
+            conn.execute("INSERT OR IGNORE INTO results_computation (id, state) VALUES (1, 'idle')")
+        
+        # users.email compares NOCASE; SQLite can't change a column's collation in place.
+        # Ids and the AUTOINCREMENT high-water mark are kept, so sessions stay valid.
+        if 'users_email_nocase' in pending:
+            seq = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'users'").fetchone()
+            conn.execute(
+                """CREATE TABLE users_nocase (
+                     id INTEGER PRIMARY KEY AUTOINCREMENT,
+                     name TEXT NOT NULL,
+                     email TEXT UNIQUE NOT NULL COLLATE NOCASE,
+                     ccpc_profile_id TEXT NOT NULL,
+                     is_admin BOOLEAN DEFAULT FALSE
+                   )"""
+            )
+            conn.execute(
+                """INSERT INTO users_nocase (id, name, email, ccpc_profile_id, is_admin)
+                   SELECT id, name, email, ccpc_profile_id, is_admin FROM users"""
+            )
+            conn.execute("DROP TABLE users")
+            conn.execute("ALTER TABLE users_nocase RENAME TO users")
+            if seq is not None:
+                conn.execute("UPDATE sqlite_sequence SET seq = ? WHERE name = 'users'", (seq[0],))
+        
+        # Winner names now come from candidates; drop the old copy
+        if 'drop_winner_name' in pending:
+            conn.execute("ALTER TABLE election_winners DROP COLUMN candidate_name")
+        
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
 # ============ CCPC PROFILE URL PARSING ============
 
+PROFILE_URL_RE = re.compile(r'/profile/([A-Za-z0-9]+)$')
+PROFILE_ID_RE = re.compile(r'[A-Za-z0-9]+')
+
 def extract_ccpc_profile_id(ccpc_url):
     """
     Extract profile ID from CCPC profile URL.
@@ -75,12 +211,12 @@ def extract_ccpc_profile_id(ccpc_url):
     ccpc_url = ccpc_url.strip()
     
     # Try to extract from URL pattern
-    match = re.search(r'/profile/([A-Za-z0-9]+)$', ccpc_url)
+    match = PROFILE_URL_RE.search(ccpc_url)
     if match:
         return match.group(1)
     
     # If no URL pattern, assume it's just the ID
-    if re.match(r'^[A-Za-z0-9]+$', ccpc_url):
+    if PROFILE_ID_RE.fullmatch(ccpc_url):
         return ccpc_url
     
     return None
@@ -88,15 +224,18 @@ def extract_ccpc_profile_id(ccpc_url):
 
 # ============ USER FUNCTIONS ============
 
+# Shared by init_db, init_all.py and app.py's auto-initialization
+SQL_INSERT_USER = "INSERT OR IGNORE INTO users (name, email, ccpc_profile_id, is_admin) VALUES (?, ?, ?, ?)"
+
 def get_user_by_email(email):
-    """Fetch user by email."""
+    """Fetch user by email; users.email compares NOCASE."""
     db = get_db()
-    cursor = db.execute("SELECT * FROM users WHERE email = ?", (email.lower().strip(),))
+    cursor = db.execute("SELECT * FROM users WHERE email = ?", (email.strip(),))
     return cursor.fetchone()
 
 
 def get_user_by_id(user_id):
-    """Fetch user by ID."""
+    """Fetch user by ID (app.py keeps it on g for the rest of the request)."""
     db = get_db()
     cursor = db.execute("SELECT * FROM users WHERE id = ?", (user_id,))
     return cursor.fetchone()
@@ -141,7 +280,7 @@ def create_member(name, email, ccpc_profile_id, is_admin=False):
 # ============ CANDIDATE FUNCTIONS ============
 
 def get_candidates_by_category(category):
-    """Get all candidates for a specific category."""
+    """Get all candidates for a specific category (served from idx_candidates_cat_name)."""
     db = get_db()
     cursor = db.execute(
         "SELECT * FROM candidates WHERE category = ? ORDER BY name",
@@ -159,7 +298,7 @@ def get_all_candidates():
 
 def add_candidate(name, category):
     """Add a new candidate."""
-    if category not in CATEGORIES:
+    if category not in CATEGORIES_SET:
         return False
     db = get_db()
     db.execute(
@@ -192,48 +331,76 @@ def record_vote(category, candidate_id, voter_hash):
     Record a vote. Returns True on success, False if already voted.
     The UNIQUE constraint on (category, voter_hash) prevents double voting.
     """
-    if category not in CATEGORIES:
+    if category not in CATEGORIES_SET:
         return False, "Invalid category"
     
     db = get_db()
     
-    # Verify candidate exists and belongs to category
-    cursor = db.execute(
-        "SELECT id FROM candidates WHERE id = ? AND category = ?",
-        (candidate_id, category)
-    )
-    if cursor.fetchone() is None:
-        return False, "Invalid candidate"
-    
+    # Take the write lock up front: one transaction, one commit per vote
+    db.execute("BEGIN IMMEDIATE")
     try:
+        # Verify candidate exists and belongs to category
+        cursor = db.execute(
+            "SELECT id FROM candidates WHERE id = ? AND category = ?",
+            (candidate_id, category)
+        )
+        if cursor.fetchone() is None:
+            db.execute("ROLLBACK")
+            return False, "Invalid candidate"
+        
         db.execute(
             "INSERT INTO votes (category, candidate_id, voter_hash) VALUES (?, ?, ?)",
             (category, candidate_id, voter_hash)
         )
-        db.commit()
+        db.execute("COMMIT")
         return True, "Vote recorded successfully"
     except sqlite3.IntegrityError:
+        db.execute("ROLLBACK")
         return False, "You have already voted in this category"
 
 
+def get_vote_page_state(voter_hash, category):
+    """
+    Get everything the vote page needs in one call.
+    Returns (already_voted, candidates).
+    """
+    db = get_db()
+    already_voted = bool(db.execute(
+        "SELECT EXISTS(SELECT 1 FROM votes WHERE voter_hash = ? AND category = ?)",
+        (voter_hash, category)
+    ).fetchone()[0])
+    return already_voted, get_candidates_by_category(category)
+
+
 def has_voted_in_category(voter_hash, category):
     """Check if user has voted in a specific category."""
     db = get_db()
     cursor = db.execute(
-        "SELECT id FROM votes WHERE voter_hash = ? AND category = ?",
+        "SELECT EXISTS(SELECT 1 FROM votes WHERE voter_hash = ? AND category = ?)",
         (voter_hash, category)
     )
-    return cursor.fetchone() is not None
+    return bool(cursor.fetchone()[0])
 
 
 # ============ ELECTION CONFIG FUNCTIONS ============
 
+# Seconds a read of election_config.is_active is reused for
+ELECTION_ACTIVE_TTL = 1.0
+_active_cache = [0.0, False]  # [expires_at, is_active]
+
+
 def is_election_active():
-    """Check if election is currently active."""
+    """Check if election is currently active (cached for ELECTION_ACTIVE_TTL)."""
+    now = time.monotonic()
+    if now < _active_cache[0]:
+        return _active_cache[1]
+    
     db = get_db()
     cursor = db.execute("SELECT is_active FROM election_config WHERE id = 1")
     row = cursor.fetchone()
-    return row['is_active'] if row else False
+    active = row['is_active'] if row else False
+    _active_cache[:] = [now + ELECTION_ACTIVE_TTL, active]
+    return active
 
 
 def toggle_election():
@@ -244,11 +411,14 @@ def toggle_election():
     
     if row:
         new_status = not row['is_active']
-        timestamp_field = 'started_at' if new_status else 'ended_at'
-        db.execute(
-            f"UPDATE election_config SET is_active = ?, {timestamp_field} = CURRENT_TIMESTAMP WHERE id = 1",
-            (new_status,)
-        )
+        if new_status:
+            db.execute(
+                "UPDATE election_config SET is_active = TRUE, started_at = CURRENT_TIMESTAMP WHERE id = 1"
+            )
+        else:
+            db.execute(
+                "UPDATE election_config SET is_active = FALSE, ended_at = CURRENT_TIMESTAMP WHERE id = 1"
+            )
     else:
         new_status = True
         db.execute(
@@ -256,6 +426,7 @@ def toggle_election():
         )
     
     db.commit()
+    _active_cache[0] = 0.0
     return new_status
 
 
@@ -282,19 +453,20 @@ def get_results():
         GROUP BY c.id
         ORDER BY c.category, vote_count DESC
     """)
-    
-    results = {}
-    for row in cursor.fetchall():
-        category = row['category']
-        if category not in results:
-            results[category] = []
-        results[category].append({
+    return _group_results(cursor.fetchall())
+
+
+def _group_results(rows):
+    """Group candidate tally rows into {category: [candidate, ...]}."""
+    results = defaultdict(list)
+    for row in rows:
+        results[row['category']].append({
             'name': row['candidate_name'],
             'id': row['candidate_id'],
             'votes': row['vote_count']
         })
     
-    return results
+    return dict(results)
 
 
 def get_total_voters():
@@ -305,6 +477,94 @@ def get_total_voters():
     return row['count'] if row else 0
 
 
+def get_admin_dashboard_snapshot():
+    """
+    Get results, election status and total voters for the admin dashboard.
+    Tallies and the voter count come back from a single query.
+    """
+    db = get_db()
+    cursor = db.execute("""
+        WITH tallies AS (
+            SELECT 
+                c.category,
+                c.name as candidate_name,
+                c.id as candidate_id,
+                COUNT(v.id) as vote_count
+            FROM candidates c
+            LEFT JOIN votes v ON c.id = v.candidate_id
+            GROUP BY c.id
+        )
+        SELECT 
+            t.*,
+            (SELECT COUNT(DISTINCT voter_hash) FROM votes) as total_voters
+        FROM tallies t
+        ORDER BY t.category, t.vote_count DESC
+    """)
+    rows = cursor.fetchall()
+    positions, winners, ranked_voter_count = get_position_overview()
+    
+    return {
+        'results': _group_results(rows),
+        'election_status': get_election_status(),
+        'total_voters': rows[0]['total_voters'] if rows else 0,
+        'positions': positions,
+        'winners': winners,
+        'ranked_voter_count': ranked_voter_count
+    }
+
+
+def get_position_overview():
+    """
+    Get positions with their saved winner and live status from one query.
+    Returns (positions, winners, ranked_voter_count), positions in rank order.
+    """
+    db = get_db()
+    cursor = db.execute("""
+        SELECT 
+            ep.position_code,
+            ep.position_name,
+            ep.rank_order,
+            ep.is_active,
+            ep.opens_at,
+            ep.closes_at,
+            ew.candidate_id,
+            c.name as candidate_name,
+            ew.vote_count,
+            (SELECT COUNT(DISTINCT voter_hash) FROM ranked_votes) as ranked_voter_count
+        FROM election_positions ep
+        LEFT JOIN election_winners ew ON ew.position_code = ep.position_code
+        LEFT JOIN candidates c ON c.id = ew.candidate_id
+        ORDER BY ep.rank_order
+    """)
+    rows = cursor.fetchall()
+    now = datetime.now()
+    
+    positions = []
+    winners = []
+    for row in rows:
+        positions.append({
+            'code': row['position_code'],
+            'name': row['position_name'],
+            'rank_order': row['rank_order'],
+            'is_active': row['is_active'],
+            'is_currently_active': bool(row['is_active']) and _within_timeline(row, now),
+            'opens_at': row['opens_at'],
+            'closes_at': row['closes_at']
+        })
+        if row['candidate_id'] is not None:
+            winners.append({
+                'position_code': row['position_code'],
+                'position_name': row['position_name'],
+                'rank_order': row['rank_order'],
+                'candidate_id': row['candidate_id'],
+                'candidate_name': row['candidate_name'],
+                'vote_count': row['vote_count']
+            })
+    
+    ranked_voter_count = rows[0]['ranked_voter_count'] if rows else 0
+    return positions, winners, ranked_voter_count
+
+
 # ============ POSITION MANAGEMENT FUNCTIONS ============
 
 def get_all_positions():
@@ -318,13 +578,30 @@ def get_all_positions():
 
 
 def get_position(position_code):
-    """Get a specific position by code."""
+    """Get a specific position by code (cached per process)."""
+    try:
+        return _cached_position(position_code)
+    except LookupError:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _cached_position(position_code):
+    """Position row by code; cleared by clear_position_cache()."""
     db = get_db()
     cursor = db.execute(
         "SELECT * FROM election_positions WHERE position_code = ?",
         (position_code,)
     )
-    return cursor.fetchone()
+    row = cursor.fetchone()
+    if row is None:
+        raise LookupError(position_code)
+    return row
+
+
+def clear_position_cache():
+    """Drop cached position rows after a position changes."""
+    _cached_position.cache_clear()
 
 
 def toggle_position(position_code):
@@ -343,6 +620,7 @@ def toggle_position(position_code):
             (new_status, position_code)
         )
         db.commit()
+        clear_position_cache()
         return new_status
     return False
 
@@ -357,28 +635,16 @@ def set_position_timeline(position_code, opens_at, closes_at):
         (opens_at, closes_at, position_code)
     )
     db.commit()
+    clear_position_cache()
     return True
 
 
-def is_position_active(position_code):
-    """Check if a specific position's voting is currently active."""
-    from datetime import datetime
-    db = get_db()
-    cursor = db.execute(
-        "SELECT is_active, opens_at, closes_at FROM election_positions WHERE position_code = ?",
-        (position_code,)
-    )
-    row = cursor.fetchone()
-    
-    if not row or not row['is_active']:
-        return False
-    
+def _within_timeline(row, now):
+    """Check a position row's opens_at/closes_at bounds against now."""
     # If no timeline set, just use is_active flag
     if not row['opens_at'] and not row['closes_at']:
         return True
     
-    now = datetime.now()
-    
     # Check timeline bounds
     if row['opens_at']:
         opens = datetime.fromisoformat(row['opens_at']) if isinstance(row['opens_at'], str) else row['opens_at']
@@ -393,10 +659,45 @@ def is_position_active(position_code):
     return True
 
 
+def is_position_active(position_code, row=None, now=None):
+    """
+    Check if a specific position's voting is currently active.
+    Pass an already-fetched election_positions row to skip the query.
+    """
+    if row is None:
+        db = get_db()
+        cursor = db.execute(
+            "SELECT is_active, opens_at, closes_at FROM election_positions WHERE position_code = ?",
+            (position_code,)
+        )
+        row = cursor.fetchone()
+    
+    if not row or not row['is_active']:
+        return False
+    
+    return _within_timeline(row, now or datetime.now())
+
+
+def get_active_position_set():
+    """Get a frozenset of currently active position codes using one query."""
+    db = get_db()
+    cursor = db.execute(
+        "SELECT position_code, opens_at, closes_at FROM election_positions WHERE is_active"
+    )
+    now = datetime.now()
+    return frozenset(
+        row['position_code'] for row in cursor.fetchall() if _within_timeline(row, now)
+    )
+
+
 def get_active_positions():
     """Get list of currently active position codes."""
     positions = get_all_positions()
-    return [p['position_code'] for p in positions if is_position_active(p['position_code'])]
+    now = datetime.now()
+    return [
+        p['position_code'] for p in positions
+        if is_position_active(p['position_code'], row=p, now=now)
+    ]
 
 
 # ============ RANKED VOTING FUNCTIONS ============
@@ -407,40 +708,47 @@ def record_ranked_votes(voter_hash, position_code, ranked_candidate_ids):
     ranked_candidate_ids: list of candidate IDs in preference order (first = most preferred)
     Returns (success, message)
     """
-    if position_code not in CATEGORIES:
+    if position_code not in CATEGORIES_SET:
         return False, "Invalid position"
     
     db = get_db()
     
-    # Check if already voted for this position
-    cursor = db.execute(
-        "SELECT id FROM ranked_votes WHERE voter_hash = ? AND position_code = ?",
-        (voter_hash, position_code)
-    )
-    if cursor.fetchone():
-        return False, "You have already voted for this position"
-    
-    # Validate all candidate IDs belong to this position
-    for cand_id in ranked_candidate_ids:
+    # Check, validate and insert the whole ballot under one write lock
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        # Check if already voted for this position
         cursor = db.execute(
-            "SELECT id FROM candidates WHERE id = ? AND category = ?",
-            (cand_id, position_code)
+            "SELECT id FROM ranked_votes WHERE voter_hash = ? AND position_code = ?",
+            (voter_hash, position_code)
         )
-        if not cursor.fetchone():
-            return False, f"Invalid candidate ID: {cand_id}"
-    
-    # Insert ranked votes
-    try:
-        for rank, cand_id in enumerate(ranked_candidate_ids, start=1):
-            db.execute(
-                """INSERT INTO ranked_votes 
-                   (voter_hash, position_code, candidate_id, preference_rank) 
-                   VALUES (?, ?, ?, ?)""",
-                (voter_hash, position_code, cand_id, rank)
-            )
-        db.commit()
+        if cursor.fetchone():
+            db.execute("ROLLBACK")
+            return False, "You have already voted for this position"
+        
+        # Validate all candidate IDs belong to this position in one query
+        placeholders = ",".join("?" * len(ranked_candidate_ids))
+        cursor = db.execute(
+            f"SELECT id FROM candidates WHERE category = ? AND id IN ({placeholders})",
+            (position_code, *ranked_candidate_ids)
+        )
+        valid_ids = {row['id'] for row in cursor.fetchall()}
+        for cand_id in ranked_candidate_ids:
+            if cand_id not in valid_ids:
+                db.execute("ROLLBACK")
+                return False, f"Invalid candidate ID: {cand_id}"
+        
+        # Insert ranked votes
+        db.executemany(
+            """INSERT INTO ranked_votes 
+               (voter_hash, position_code, candidate_id, preference_rank) 
+               VALUES (?, ?, ?, ?)""",
+            [(voter_hash, position_code, cand_id, rank)
+             for rank, cand_id in enumerate(ranked_candidate_ids, start=1)]
+        )
+        db.execute("COMMIT")
         return True, "Votes recorded successfully"
     except sqlite3.IntegrityError as e:
+        db.execute("ROLLBACK")
         return False, f"Error recording votes: {e}"
 
 
@@ -448,10 +756,10 @@ def has_voted_for_position(voter_hash, position_code):
     """Check if voter has submitted ranked votes for a position."""
     db = get_db()
     cursor = db.execute(
-        "SELECT id FROM ranked_votes WHERE voter_hash = ? AND position_code = ? LIMIT 1",
+        "SELECT EXISTS(SELECT 1 FROM ranked_votes WHERE voter_hash = ? AND position_code = ?)",
         (voter_hash, position_code)
     )
-    return cursor.fetchone() is not None
+    return bool(cursor.fetchone()[0])
 
 
 def get_voter_preferences(voter_hash, position_code):
@@ -471,11 +779,11 @@ def get_voter_preferences(voter_hash, position_code):
 def get_ranked_voted_positions(voter_hash):
     """Get list of positions voter has submitted ranked votes for."""
     db = get_db()
-    cursor = db.execute(
+    cursor = _tuple_cursor(db).execute(
         "SELECT DISTINCT position_code FROM ranked_votes WHERE voter_hash = ?",
         (voter_hash,)
     )
-    return [row['position_code'] for row in cursor.fetchall()]
+    return [position_code for (position_code,) in cursor.fetchall()]
 
 
 # ============ RECOMPUTATION ALGORITHM ============
@@ -502,57 +810,59 @@ def compute_position_winner(position_code, excluded_candidate_ids=None):
     
     db = get_db()
     
-    # Get all unique voters for this position
-    cursor = db.execute(
-        "SELECT DISTINCT voter_hash FROM ranked_votes WHERE position_code = ?",
+    # Fetch every ballot for this position in one query, grouped by voter
+    cursor = _tuple_cursor(db).execute(
+        """SELECT voter_hash, candidate_id FROM ranked_votes 
+           WHERE position_code = ?
+           ORDER BY voter_hash, preference_rank""",
         (position_code,)
     )
-    voters = [row['voter_hash'] for row in cursor.fetchall()]
+    ballots = [
+        [cand_id for _, cand_id in ballot]
+        for _, ballot in groupby(cursor.fetchall(), key=itemgetter(0))
+    ]
     
-    # Count effective first-preference votes
-    vote_counts = {}  # candidate_id -> count
+    # Candidate names for this position in one query
+    cursor = db.execute(
+        "SELECT id, name FROM candidates WHERE category = ? ORDER BY id",
+        (position_code,)
+    )
+    candidate_names = {row['id']: row['name'] for row in cursor.fetchall()}
     
-    for voter_hash in voters:
-        # Get this voter's preferences in order
-        cursor = db.execute(
-            """SELECT candidate_id FROM ranked_votes 
-               WHERE voter_hash = ? AND position_code = ?
-               ORDER BY preference_rank""",
-            (voter_hash, position_code)
+    return _tally_ballots(position_code, ballots, candidate_names, excluded_candidate_ids)
+
+
+def _tally_ballots(position_code, ballots, candidate_names, excluded_candidate_ids):
+    """
+    Tally one position's ballots in memory.
+    ballots: list of candidate-id lists in preference order, one per voter.
+    candidate_names: {candidate_id: name} for the position's candidates.
+    """
+    # Count effective first-preference votes (candidate_id -> count)
+    if excluded_candidate_ids:
+        # First non-excluded candidate per ballot; None means the vote is exhausted
+        choices = (
+            next((cand_id for cand_id in ballot if cand_id not in excluded_candidate_ids), None)
+            for ballot in ballots
         )
-        preferences = [row['candidate_id'] for row in cursor.fetchall()]
-        
-        # Find first non-excluded candidate
-        for cand_id in preferences:
-            if cand_id not in excluded_candidate_ids:
-                vote_counts[cand_id] = vote_counts.get(cand_id, 0) + 1
-                break
-        # If all preferences are excluded, this voter's vote is exhausted
-    
-    # Get candidate details and build results
-    results = []
-    for cand_id, count in vote_counts.items():
-        cursor = db.execute("SELECT id, name FROM candidates WHERE id = ?", (cand_id,))
-        cand = cursor.fetchone()
-        if cand:
-            results.append({
-                'id': cand['id'],
-                'name': cand['name'],
-                'votes': count
-            })
+    else:
+        choices = (ballot[0] for ballot in ballots)
+    vote_counts = Counter(choices)
+    vote_counts.pop(None, None)
+    
+    # Build results
+    results = [
+        {'id': cand_id, 'name': candidate_names[cand_id], 'votes': count}
+        for cand_id, count in vote_counts.items()
+        if cand_id in candidate_names
+    ]
     
     # Add candidates with zero votes (not in any voter's top choice after exclusions)
-    cursor = db.execute(
-        "SELECT id, name FROM candidates WHERE category = ?",
-        (position_code,)
-    )
-    all_candidates = cursor.fetchall()
-    existing_ids = {r['id'] for r in results}
-    for cand in all_candidates:
-        if cand['id'] not in existing_ids and cand['id'] not in excluded_candidate_ids:
+    for cand_id, name in candidate_names.items():
+        if cand_id not in vote_counts and cand_id not in excluded_candidate_ids:
             results.append({
-                'id': cand['id'],
-                'name': cand['name'],
+                'id': cand_id,
+                'name': name,
                 'votes': 0
             })
     
@@ -565,8 +875,8 @@ def compute_position_winner(position_code, excluded_candidate_ids=None):
         'position_code': position_code,
         'winner': winner,
         'results': results,
-        'total_voters': len(voters),
-        'exhausted_votes': len(voters) - sum(vote_counts.values())
+        'total_voters': len(ballots),
+        'exhausted_votes': len(ballots) - sum(vote_counts.values())
     }
 
 
@@ -591,13 +901,35 @@ def compute_all_results():
     )
     positions = cursor.fetchall()
     
+    # Read every ballot once and bucket by position
+    cursor = _tuple_cursor(db).execute(
+        """SELECT position_code, voter_hash, candidate_id FROM ranked_votes 
+           ORDER BY position_code, voter_hash, preference_rank"""
+    )
+    ballots_by_position = {}
+    for (position_code, _), ballot in groupby(cursor.fetchall(), key=itemgetter(0, 1)):
+        ballots_by_position.setdefault(position_code, []).append(
+            [cand_id for _, _, cand_id in ballot]
+        )
+    
+    # Candidate names for every position in one query
+    cursor = db.execute("SELECT id, name, category FROM candidates ORDER BY id")
+    names_by_position = {}
+    for row in cursor.fetchall():
+        names_by_position.setdefault(row['category'], {})[row['id']] = row['name']
+    
     excluded_candidates = set()
     all_results = []
     
     for pos in positions:
         position_code = pos['position_code']
         
-        result = compute_position_winner(position_code, excluded_candidates)
+        result = _tally_ballots(
+            position_code,
+            ballots_by_position.get(position_code, []),
+            names_by_position.get(position_code, {}),
+            excluded_candidates
+        )
         result['position_name'] = pos['position_name']
         
         # Add winner to exclusion set for subsequent positions
@@ -614,32 +946,65 @@ def save_election_winners(results):
     Save computed winners to election_winners table.
     Clears existing winners and saves new ones.
     """
-    db = get_db()
-    
-    # Clear existing winners
-    db.execute("DELETE FROM election_winners")
+    rows = [
+        (result['position_code'], result['winner']['id'], result['winner']['votes'])
+        for result in results if result['winner']
+    ]
     
-    # Save new winners
-    for result in results:
-        if result['winner']:
-            db.execute(
-                """INSERT INTO election_winners 
-                   (position_code, candidate_id, candidate_name, vote_count)
-                   VALUES (?, ?, ?, ?)""",
-                (result['position_code'], result['winner']['id'], 
-                 result['winner']['name'], result['winner']['votes'])
-            )
+    db = get_db()
     
+    # Clear and re-insert in one transaction; a failed insert keeps the old winners
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        db.execute("DELETE FROM election_winners")
+        db.executemany(
+            """INSERT INTO election_winners 
+               (position_code, candidate_id, vote_count)
+               VALUES (?, ?, ?)""",
+            rows
+        )
+        db.execute("COMMIT")
+    except Exception:
+        db.execute("ROLLBACK")
+        raise
+
+
+def set_computation_state(state):
+    """
+    Record the background results computation state.
+    'running' stamps started_at; any other state stamps completed_at.
+    """
+    db = get_db()
+    if state == 'running':
+        db.execute(
+            """UPDATE results_computation 
+               SET state = ?, started_at = CURRENT_TIMESTAMP, completed_at = NULL 
+               WHERE id = 1""",
+            (state,)
+        )
+    else:
+        db.execute(
+            "UPDATE results_computation SET state = ?, completed_at = CURRENT_TIMESTAMP WHERE id = 1",
+            (state,)
+        )
     db.commit()
 
 
+def get_computation_status():
+    """Get the background results computation status row."""
+    db = get_db()
+    cursor = db.execute("SELECT * FROM results_computation WHERE id = 1")
+    return cursor.fetchone()
+
+
 def get_election_winners():
     """Get saved election winners."""
     db = get_db()
     cursor = db.execute("""
-        SELECT ew.*, ep.position_name, ep.rank_order
+        SELECT ew.*, c.name as candidate_name, ep.position_name, ep.rank_order
         FROM election_winners ew
         JOIN election_positions ep ON ew.position_code = ep.position_code
+        JOIN candidates c ON c.id = ew.candidate_id
         ORDER BY ep.rank_order
     """)
     return cursor.fetchall()
@@ -651,3 +1016,17 @@ def get_ranked_vote_count():
     cursor = db.execute("SELECT COUNT(DISTINCT voter_hash) as count FROM ranked_votes")
     row = cursor.fetchone()
     return row['count'] if row else 0
+
+
+def get_results_version():
+    """
+    Cheap fingerprint of everything compute_all_results() reads:
+    (row count, highest id) of ranked_votes and of candidates, in one query.
+    Changes whenever a ballot or candidate is added or removed, in any process.
+    """
+    db = get_db()
+    return tuple(db.execute("""
+        SELECT
+            (SELECT COUNT(*) FROM ranked_votes), (SELECT MAX(id) FROM ranked_votes),
+            (SELECT COUNT(*) FROM candidates), (SELECT MAX(id) FROM candidates)
+    """).fetchone())
@@ -5,7 +5,7 @@
 CREATE TABLE IF NOT EXISTS users (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
   name TEXT NOT NULL,
-  email TEXT UNIQUE NOT NULL,
+  email TEXT UNIQUE NOT NULL COLLATE NOCASE,
   ccpc_profile_id TEXT NOT NULL,
   is_admin BOOLEAN DEFAULT FALSE
 );
@@ -80,8 +80,32 @@ CREATE TABLE IF NOT EXISTS election_winners (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
   position_code TEXT NOT NULL UNIQUE,
   candidate_id INTEGER NOT NULL,
-  candidate_name TEXT NOT NULL,
   elected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   vote_count INTEGER,
   FOREIGN KEY (candidate_id) REFERENCES candidates(id)
 );
+
+-- Background results computation status (singleton, like election_config)
+CREATE TABLE IF NOT EXISTS results_computation (
+  id INTEGER PRIMARY KEY CHECK (id = 1),
+  state TEXT NOT NULL DEFAULT 'idle',  -- idle, running, done, failed
+  started_at TIMESTAMP,
+  completed_at TIMESTAMP
+);
+
+-- Initialize computation status
+INSERT OR IGNORE INTO results_computation (id, state) VALUES (1, 'idle');
+
+-- ============ INDEXES FOR HOT READ PATHS ============
+
+-- Candidates per category in name order (vote page, seed verification)
+CREATE INDEX IF NOT EXISTS idx_candidates_cat_name ON candidates(category, name);
+
+-- Categories a voter has voted in (dashboard, vote page)
+CREATE INDEX IF NOT EXISTS idx_votes_voter ON votes(voter_hash, category);
+
+-- Vote counts per candidate (results)
+CREATE INDEX IF NOT EXISTS idx_votes_candidate ON votes(candidate_id);
+
+-- Ballots per position in preference order, answered from the index alone
+CREATE INDEX IF NOT EXISTS idx_ranked_pos ON ranked_votes(position_code, voter_hash, preference_rank, candidate_id);
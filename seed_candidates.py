@@ -6,14 +6,24 @@ Usage: python seed_candidates.py
 """
 
 import sqlite3
+import sys
 
 DATABASE = 'election.db'
 
+
+def open_db():
+    """Open the election database with write-friendly pragmas."""
+    conn = sqlite3.connect(DATABASE, isolation_level=None)
+    conn.executescript(
+        "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA busy_timeout=5000; "
+        "PRAGMA temp_store=MEMORY; PRAGMA cache_size=-64000;"
+    )
+    return conn
+
 # ============ NOMINATION DATA (EXPLICIT ASSIGNMENTS) ============
 
 # All 16 nominees (appear in all non-VP categories)
-# All 16 nominees (appear in all non-VP categories)
-ALL_NOMINEES = [
+ALL_NOMINEES = (
     "Sanskar",
     "Raj Vardhan Jha",
     "Abhishek",
@@ -29,7 +39,7 @@ ALL_NOMINEES = [
     "Raj Vardhan Rathore",
     "Ashish Sahu",
     "Basil Joy",
-]
+)
 
 # Vice President nominees (VP) - separate list
 VP_CANDIDATES = [
@@ -45,95 +55,86 @@ TREASURER_CANDIDATES = [
     "Aditya Singh Chandel",
 ]
 
-# All other categories get all 17 nominees
-GS_CANDIDATES = ALL_NOMINEES.copy()
-JS1_CANDIDATES = ALL_NOMINEES.copy()
-JS2_CANDIDATES = ALL_NOMINEES.copy()
-EXEC_TECH_CANDIDATES = ALL_NOMINEES.copy()
-EXEC_DESIGN_CANDIDATES = ALL_NOMINEES.copy()
-EXEC_PR_CANDIDATES = ALL_NOMINEES.copy()
-
 
-def seed_candidates():
+def seed_candidates(conn):
     """Insert all candidates into the database."""
     
-    conn = sqlite3.connect(DATABASE)
-    cursor = conn.cursor()
+    # Bulk-load window: no fsync; WAL stays on so a running app can keep its connections
+    conn.execute("PRAGMA synchronous=OFF")
     
-    # Category to candidates mapping
+    # Category to candidates mapping; all other categories share ALL_NOMINEES
     categories = {
         'VP': VP_CANDIDATES,
-        'GS': GS_CANDIDATES,
-        'JS1': JS1_CANDIDATES,
-        'JS2': JS2_CANDIDATES,
+        'GS': ALL_NOMINEES,
+        'JS1': ALL_NOMINEES,
+        'JS2': ALL_NOMINEES,
         'TREASURER': TREASURER_CANDIDATES,
-        'EXEC_TECH': EXEC_TECH_CANDIDATES,
-        'EXEC_DESIGN': EXEC_DESIGN_CANDIDATES,
-        'EXEC_PR': EXEC_PR_CANDIDATES,
+        'EXEC_TECH': ALL_NOMINEES,
+        'EXEC_DESIGN': ALL_NOMINEES,
+        'EXEC_PR': ALL_NOMINEES,
     }
     
-    results = {}
-    
+    # Take the write lock once for the whole batch: no lock upgrade mid-load
+    conn.execute("BEGIN IMMEDIATE")
     for category, candidates in categories.items():
-        inserted = 0
-        for name in candidates:
-            try:
-                # INSERT OR IGNORE prevents duplicate (name, category) entries
-                cursor.execute(
-                    "INSERT OR IGNORE INTO candidates (name, category) VALUES (?, ?)",
-                    (name, category)
-                )
-                if cursor.rowcount > 0:
-                    inserted += 1
-            except sqlite3.Error as e:
-                print(f"Error inserting {name} into {category}: {e}")
-        
-        results[category] = inserted
+        # One multi-row INSERT per category; well under SQLite's bound-variable limit
+        # INSERT OR IGNORE prevents duplicate (name, category) entries
+        conn.execute(
+            "INSERT OR IGNORE INTO candidates (name, category) VALUES "
+            + ", ".join(["(?, ?)"] * len(candidates)),
+            [value for name in candidates for value in (name, category)]
+        )
+    conn.execute("COMMIT")
+    
+    # Per-category totals from one aggregate query
+    results = dict(conn.execute("SELECT category, COUNT(*) FROM candidates GROUP BY category"))
     
-    conn.commit()
-    conn.close()
+    # Restore the usual durability setting
+    conn.execute("PRAGMA synchronous=NORMAL")
     
     # Print summary
     print("\n" + "=" * 50)
     print("CANDIDATE SEEDING COMPLETE")
     print("=" * 50)
-    print(f"VP candidates inserted:          {results['VP']}")
-    print(f"GS candidates inserted:          {results['GS']}")
-    print(f"JS1 candidates inserted:         {results['JS1']}")
-    print(f"JS2 candidates inserted:         {results['JS2']}")
-    print(f"TREASURER candidates inserted:   {results['TREASURER']}")
-    print(f"EXEC_TECH candidates inserted:   {results['EXEC_TECH']}")
-    print(f"EXEC_DESIGN candidates inserted: {results['EXEC_DESIGN']}")
-    print(f"EXEC_PR candidates inserted:     {results['EXEC_PR']}")
+    print(f"VP candidates:          {results.get('VP', 0)}")
+    print(f"GS candidates:          {results.get('GS', 0)}")
+    print(f"JS1 candidates:         {results.get('JS1', 0)}")
+    print(f"JS2 candidates:         {results.get('JS2', 0)}")
+    print(f"TREASURER candidates:   {results.get('TREASURER', 0)}")
+    print(f"EXEC_TECH candidates:   {results.get('EXEC_TECH', 0)}")
+    print(f"EXEC_DESIGN candidates: {results.get('EXEC_DESIGN', 0)}")
+    print(f"EXEC_PR candidates:     {results.get('EXEC_PR', 0)}")
     print("-" * 50)
-    print(f"TOTAL inserted: {sum(results.values())}")
+    print(f"TOTAL candidates: {sum(results.values())}")
     print("=" * 50)
 
 
-def verify_candidates():
+def verify_candidates(conn):
     """Query and display all candidates."""
     
-    conn = sqlite3.connect(DATABASE)
-    conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    out = []  # written to stdout in one call at the end
     
-    print("\n" + "=" * 50)
-    print("VERIFICATION: All Candidates")
-    print("=" * 50)
+    out.append("\n" + "=" * 50)
+    out.append("VERIFICATION: All Candidates")
+    out.append("=" * 50)
     
+    # Ordered straight off idx_candidates_cat_name; read in batches
+    cursor.arraysize = 200
     cursor.execute("SELECT name, category FROM candidates ORDER BY category, name")
-    rows = cursor.fetchall()
     
     current_category = None
-    for row in rows:
-        if row['category'] != current_category:
-            current_category = row['category']
-            print(f"\n[{current_category}]")
-        print(f"  - {row['name']}")
+    while rows := cursor.fetchmany():
+        for row in rows:
+            if row['category'] != current_category:
+                current_category = row['category']
+                out.append(f"\n[{current_category}]")
+            out.append(f"  - {row['name']}")
     
     # Count by category
-    print("\n" + "-" * 50)
-    print("Summary by Category:")
+    out.append("\n" + "-" * 50)
+    out.append("Summary by Category:")
     cursor.execute("""
         SELECT category, COUNT(*) as count 
         FROM candidates 
@@ -141,17 +142,23 @@ def verify_candidates():
         ORDER BY category
     """)
     for row in cursor.fetchall():
-        print(f"  {row['category']:12s}: {row['count']} candidates")
+        out.append(f"  {row['category']:12s}: {row['count']} candidates")
     
     # Total unique candidates
     cursor.execute("SELECT COUNT(DISTINCT name) as count FROM candidates")
     unique_count = cursor.fetchone()['count']
-    print(f"\nUnique names across all categories: {unique_count}")
+    out.append(f"\nUnique names across all categories: {unique_count}")
     
-    conn.close()
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
     print("Seeding candidates into election.db...")
-    seed_candidates()
-    verify_candidates()
+    conn = open_db()
+    try:
+        seed_candidates(conn)
+        verify_candidates(conn)
+    except sqlite3.Error as e:
+        raise SystemExit(f"✗ Seeding failed: {e}")
+    finally:
+        conn.close()
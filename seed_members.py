@@ -6,9 +6,20 @@ Usage: python seed_members.py
 """
 
 import sqlite3
+import sys
 
 DATABASE = 'election.db'
 
+
+def open_db():
+    """Open the election database with write-friendly pragmas."""
+    conn = sqlite3.connect(DATABASE, isolation_level=None)
+    conn.executescript(
+        "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA busy_timeout=5000; "
+        "PRAGMA temp_store=MEMORY; PRAGMA cache_size=-64000;"
+    )
+    return conn
+
 # ============ MEMBER DATA ============
 # Add members as: (name, email, ccpc_profile_id)
 # The ccpc_profile_id is extracted from: https://ccpc-cuj.web.app/profile/{ID}
@@ -23,63 +34,68 @@ MEMBERS = [
     # ("Priyanshu Verma", "priyanshu.xxxxx@cuj.ac.in", "PROFILE_ID_HERE"),
 ]
 
+# Normalize emails once here so the insert just binds ready tuples
+MEMBERS = [(name, email.lower().strip(), ccpc_id) for name, email, ccpc_id in MEMBERS]
 
-def seed_members():
+
+def seed_members(conn):
     """Insert all members into the database."""
     
-    conn = sqlite3.connect(DATABASE)
-    cursor = conn.cursor()
+    # Bulk-load window: no fsync; WAL stays on so a running app can keep its connections
+    conn.execute("PRAGMA synchronous=OFF")
     
-    inserted = 0
-    skipped = 0
+    changes_before = conn.total_changes
     
-    for name, email, ccpc_id in MEMBERS:
-        try:
-            cursor.execute(
-                "INSERT OR IGNORE INTO users (name, email, ccpc_profile_id, is_admin) VALUES (?, ?, ?, ?)",
-                (name, email.lower().strip(), ccpc_id, False)
-            )
-            if cursor.rowcount > 0:
-                inserted += 1
-                print(f"✓ Added: {name} ({email})")
-            else:
-                skipped += 1
-                print(f"⊘ Skipped (already exists): {name} ({email})")
-        except sqlite3.Error as e:
-            print(f"✗ Error adding {name}: {e}")
+    # Take the write lock once for the whole batch: no lock upgrade mid-load
+    conn.execute("BEGIN IMMEDIATE")
+    conn.executemany(
+        "INSERT OR IGNORE INTO users (name, email, ccpc_profile_id, is_admin) VALUES (?, ?, ?, FALSE)",
+        MEMBERS
+    )
+    conn.execute("COMMIT")
     
-    conn.commit()
-    conn.close()
+    inserted = conn.total_changes - changes_before
+    skipped = len(MEMBERS) - inserted
+    
+    # Restore the usual durability setting
+    conn.execute("PRAGMA synchronous=NORMAL")
     
     print("\n" + "=" * 50)
     print(f"MEMBERS SEEDED: {inserted} added, {skipped} skipped")
     print("=" * 50)
 
 
-def list_members():
+def list_members(conn):
     """List all registered members."""
     
-    conn = sqlite3.connect(DATABASE)
-    conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    out = []  # written to stdout in one call at the end
     
     cursor.execute("SELECT id, name, email, is_admin FROM users ORDER BY name")
     rows = cursor.fetchall()
     
-    print("\n" + "=" * 50)
-    print("REGISTERED MEMBERS")
-    print("=" * 50)
+    out.append("\n" + "=" * 50)
+    out.append("REGISTERED MEMBERS")
+    out.append("=" * 50)
     
     for row in rows:
         admin_tag = " [ADMIN]" if row['is_admin'] else ""
-        print(f"  {row['id']:3d}. {row['name']}{admin_tag}")
-        print(f"       {row['email']}")
+        out.append(f"  {row['id']:3d}. {row['name']}{admin_tag}")
+        out.append(f"       {row['email']}")
+    
+    out.append(f"\nTotal: {len(rows)} members")
     
-    print(f"\nTotal: {len(rows)} members")
-    conn.close()
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
     print("Seeding members into election.db...")
-    seed_members()
-    list_members()
+    conn = open_db()
+    try:
+        seed_members(conn)
+        list_members(conn)
+    except sqlite3.Error as e:
+        raise SystemExit(f"✗ Seeding failed: {e}")
+    finally:
+        conn.close()
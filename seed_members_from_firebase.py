@@ -6,111 +6,129 @@ Usage: python seed_members_from_firebase.py
 """
 
 import sqlite3
-import json
+import sys
+import ijson
 
 DATABASE = 'election.db'
 FIREBASE_EXPORT = 'soc-ccpc-cuj-default-rtdb-export.json'
 
+# Members whose Firebase profile has no email; their emails were collected by hand
+MANUAL_MEMBERS = (
+    ('Basil Joy', 'basil.23190503023@cuj.ac.in', 'ZnStO6ic3fM6MQLiI5iUBZnyyC63'),
+    ('Shashi Kumari Verma', 'shashi.24190503050@cuj.ac.in', 's8ZKdaxsWPWl1hQoTDhon47uy9O2'),
+)
+MANUAL_PROFILE_IDS = frozenset(profile_id for _, _, profile_id in MANUAL_MEMBERS)
 
-def parse_firebase_members():
-    """Parse Firebase export and extract member data."""
-    
-    with open(FIREBASE_EXPORT, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    users = data.get('users', {})
-    members = []
+
+def open_db():
+    """Open the election database with write-friendly pragmas."""
+    conn = sqlite3.connect(DATABASE, isolation_level=None)
+    conn.executescript(
+        "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA busy_timeout=5000; "
+        "PRAGMA temp_store=MEMORY; PRAGMA cache_size=-64000;"
+    )
+    return conn
+
+
+def iter_firebase_members(no_email=None):
+    """
+    Parse Firebase export and yield member rows, followed by MANUAL_MEMBERS.
+    Yields (name, email, ccpc_profile_id) tuples ready to insert.
+    Names of members skipped for having no email are appended to no_email.
+    Shared by init_all.py and app.py so the filtering rules live in one place.
+    """
     
-    for profile_id, user_data in users.items():
-        # Skip incomplete profiles
-        if not user_data.get('completeProfile', False):
-            continue
-        
-        # Skip non-members or alumni
-        if not user_data.get('isMember', False):
-            continue
-        
-        # Get required fields
-        name = user_data.get('name', '').strip()
-        email = user_data.get('email', '').strip().lower()
-        
-        # Skip if no name or email
-        if not name:
-            continue
-        
-        if not email:
-            print(f"⚠️ Skipping {name}: No email provided")
-            continue
-        
-        # profile_id is the Firebase UID which is the CCPC profile ID
-        members.append({
-            'name': name,
-            'email': email,
-            'ccpc_profile_id': profile_id,
-            'designation': user_data.get('designation', 'Member')
-        })
+    # Stream one user at a time instead of loading the whole export
+    with open(FIREBASE_EXPORT, 'rb') as f:
+        for profile_id, user_data in ijson.kvitems(f, 'users'):
+            get = user_data.get
+            
+            # Skip incomplete profiles, non-members and alumni
+            if not get('completeProfile') or not get('isMember'):
+                continue
+            
+            # Get required fields (absent or null both read as empty)
+            name = (get('name') or '').strip()
+            email = (get('email') or '').strip().lower()
+            
+            # Skip if no name or email
+            if not name:
+                continue
+            
+            if not email:
+                if no_email is not None and profile_id not in MANUAL_PROFILE_IDS:
+                    no_email.append(name)
+                continue
+            
+            # profile_id is the Firebase UID which is the CCPC profile ID
+            yield (name, email, profile_id)
     
-    return members
+    yield from MANUAL_MEMBERS
 
 
-def seed_members():
+def seed_members(conn):
     """Insert parsed members into the database."""
     
-    members = parse_firebase_members()
+    # Bulk-load window: no fsync; WAL stays on so a running app can keep its connections
+    conn.execute("PRAGMA synchronous=OFF")
     
-    conn = sqlite3.connect(DATABASE)
-    cursor = conn.cursor()
+    no_email = []
     
-    inserted = 0
-    skipped = 0
+    # Take the write lock once for the whole batch: no lock upgrade mid-load.
+    # Stage parsed rows in a temp table, then let SQLite insert them set-based.
+    conn.execute("BEGIN IMMEDIATE")
+    conn.execute("CREATE TEMP TABLE tmp_members (name TEXT, email TEXT, ccpc_profile_id TEXT)")
+    conn.executemany("INSERT INTO tmp_members VALUES (?, ?, ?)", iter_firebase_members(no_email))
+    cursor = conn.execute(
+        """INSERT OR IGNORE INTO users (name, email, ccpc_profile_id, is_admin)
+           SELECT name, email, ccpc_profile_id, FALSE FROM tmp_members"""
+    )
+    inserted = cursor.rowcount
+    conn.execute("DROP TABLE tmp_members")
+    conn.execute("COMMIT")
     
-    for member in members:
-        try:
-            cursor.execute(
-                "INSERT OR IGNORE INTO users (name, email, ccpc_profile_id, is_admin) VALUES (?, ?, ?, ?)",
-                (member['name'], member['email'], member['ccpc_profile_id'], False)
-            )
-            if cursor.rowcount > 0:
-                inserted += 1
-                print(f"✓ Added: {member['name']} ({member['email']})")
-            else:
-                skipped += 1
-                print(f"⊘ Skipped (already exists): {member['name']}")
-        except sqlite3.Error as e:
-            print(f"✗ Error adding {member['name']}: {e}")
+    # Restore the usual durability setting
+    conn.execute("PRAGMA synchronous=NORMAL")
     
-    conn.commit()
-    conn.close()
+    if no_email:
+        print(f"⚠️ Skipped {len(no_email)} without an email: {', '.join(no_email)}")
     
     print("\n" + "=" * 60)
-    print(f"MEMBERS SEEDED FROM FIREBASE: {inserted} added, {skipped} skipped")
+    print(f"MEMBERS SEEDED FROM FIREBASE: {inserted} added (existing emails skipped)")
     print("=" * 60)
 
 
-def list_members():
+def list_members(conn):
     """List all registered members."""
     
-    conn = sqlite3.connect(DATABASE)
-    conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    out = []  # written to stdout in one call at the end
     
     cursor.execute("SELECT id, name, email, is_admin FROM users ORDER BY name")
     rows = cursor.fetchall()
     
-    print("\n" + "=" * 60)
-    print("ALL REGISTERED MEMBERS")
-    print("=" * 60)
+    out.append("\n" + "=" * 60)
+    out.append("ALL REGISTERED MEMBERS")
+    out.append("=" * 60)
     
     for row in rows:
         admin_tag = " [ADMIN]" if row['is_admin'] else ""
-        print(f"  {row['id']:3d}. {row['name']}{admin_tag}")
-        print(f"       {row['email']}")
+        out.append(f"  {row['id']:3d}. {row['name']}{admin_tag}")
+        out.append(f"       {row['email']}")
+    
+    out.append(f"\nTotal: {len(rows)} members")
     
-    print(f"\nTotal: {len(rows)} members")
-    conn.close()
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
     print(f"Parsing members from {FIREBASE_EXPORT}...")
-    seed_members()
-    list_members()
+    conn = open_db()
+    try:
+        seed_members(conn)
+        list_members(conn)
+    except sqlite3.Error as e:
+        raise SystemExit(f"✗ Seeding failed: {e}")
+    finally:
+        conn.close()
@@ -0,0 +1,29 @@
+"""
+Static checks on models.py that run without Flask or a database.
+"""
+
+import ast
+import os
+import unittest
+from collections import Counter
+
+MODELS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'models.py')
+
+
+class ModelsModuleTest(unittest.TestCase):
+
+    def test_no_duplicate_top_level_definitions(self):
+        """Each top-level function and class is defined exactly once."""
+        with open(MODELS_PATH, encoding='utf-8') as f:
+            tree = ast.parse(f.read(), filename=MODELS_PATH)
+        
+        names = Counter(
+            node.name for node in tree.body
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+        )
+        duplicates = sorted(name for name, count in names.items() if count > 1)
+        self.assertEqual(duplicates, [], f"Defined more than once in models.py: {duplicates}")
+
+
+if __name__ == '__main__':
+    unittest.main()